@@ -167,10 +167,12 @@ class TestConfig(_Config):  # pylint: disable=too-few-public-methods
 
     DEBUG = True
     TESTING = True
+    # each pytest-xdist worker (gw0, gw1, ...) runs against its own database and minio bucket
+    XDIST_WORKER = os.getenv('PYTEST_XDIST_WORKER', '')
     # POSTGRESQL
     DB_USER = os.getenv('DATABASE_TEST_USERNAME', '')
     DB_PASSWORD = os.getenv('DATABASE_TEST_PASSWORD', '')
-    DB_NAME = os.getenv('DATABASE_TEST_NAME', '')
+    DB_NAME = os.getenv('DATABASE_TEST_NAME', '') + (f'_{XDIST_WORKER}' if XDIST_WORKER else '')
     DB_HOST = os.getenv('DATABASE_TEST_HOST', '')
     DB_PORT = os.getenv('DATABASE_TEST_PORT', '5432')
     # POSTGRESQL
@@ -237,7 +239,7 @@ NrQw+2OdQACBJiEHsdZzAkBcsTk7frTH4yGx0VfHxXDPjfTj4wmD6gZIlcIr9lZg
     MINIO_ENDPOINT = 'localhost:9000'
     MINIO_ACCESS_KEY = 'minio'
     MINIO_ACCESS_SECRET = 'minio123'
-    MINIO_BUCKET_BUSINESSES = 'businesses'
+    MINIO_BUCKET_BUSINESSES = f'businesses-{XDIST_WORKER}' if XDIST_WORKER else 'businesses'
     MINIO_SECURE = False
 
     # determines which year of NAICS data will be used to drive NAICS search
@@ -13,17 +13,21 @@
 # limitations under the License.
 """Common setup and fixtures for the pytest suite used by this service."""
 import datetime
+import os
+import re
 import time
 from contextlib import contextmanager, suppress
 
 import pytest
 from flask_migrate import Migrate, upgrade
-from sqlalchemy import event, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.schema import DropConstraint, MetaData
 
 from legal_api import create_app
 from legal_api import jwt as _jwt
 from legal_api.models import db as _db
+from legal_api.services import MinioService
 
 from . import FROZEN_DATETIME
 
@@ -102,12 +106,28 @@ def client_ctx(app):  # pylint: disable=redefined-outer-name
         yield _client
 
 
+def _create_worker_database(app):  # pylint: disable=redefined-outer-name
+    """Create the database of this pytest-xdist worker, if it does not exist yet."""
+    worker_url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    admin_url = worker_url.set(database=os.getenv('DATABASE_TEST_NAME', ''))
+    engine = create_engine(admin_url, isolation_level='AUTOCOMMIT')
+    with engine.connect() as conn:
+        exists = conn.execute(text('SELECT 1 FROM pg_database WHERE datname = :name'),
+                              {'name': worker_url.database}).scalar()
+        if not exists:
+            conn.execute(text(f'CREATE DATABASE "{worker_url.database}"'))
+    engine.dispose()
+
+
 @pytest.fixture(scope='session')
 def db(app):  # pylint: disable=redefined-outer-name, invalid-name
     """Return a session-wide initialised database.
 
     Drops all existing tables - Meta follows Postgres FKs
     """
+    if app.config.get('XDIST_WORKER'):
+        _create_worker_database(app)
+
     with app.app_context():
         # Clear out any existing tables
         metadata = MetaData(_db.engine)
@@ -187,17 +207,70 @@ def session(app, db):  # pylint: disable=redefined-outer-name, invalid-name
         conn.close()
 
 
+def _is_xdist_worker(config):
+    """Return whether this process is a pytest-xdist worker."""
+    return hasattr(config, 'workerinput')
+
+
+def _is_xdist_controller(config):
+    """Return whether this process is the pytest-xdist controller of a parallel run."""
+    return not _is_xdist_worker(config) and bool(getattr(config.option, 'numprocesses', None))
+
+
+def _compose_services(config, docker_ip='127.0.0.1'):
+    """Return the docker compose services with the compose file and project name lovely-pytest-docker defaults to."""
+    from lovely.pytest.docker.compose import Services  # pylint: disable=import-outside-toplevel
+
+    compose_file = os.path.join(str(config.rootdir), 'tests', 'docker-compose.yml')
+    project_name = 'pytest' + re.sub(r'[^a-z0-9]+', '-', str(config.rootdir).lower())
+    return Services([compose_file], docker_ip, project_name)
+
+
+def pytest_sessionstart(session):
+    """Start the docker services once in the pytest-xdist controller, before its workers are spawned."""
+    if _is_xdist_controller(session.config):
+        _compose_services(session.config).start('minio', 'nats')
+
+
+def pytest_sessionfinish(session):
+    """Shut the docker services down in the pytest-xdist controller, once all of its workers are done."""
+    if _is_xdist_controller(session.config) and not session.config.getoption('--keepalive'):
+        _compose_services(session.config).shutdown()
+
+
+@pytest.fixture(scope='session')
+def docker_services(request, docker_ip):
+    """Provide the docker services, pytest-xdist workers share the ones the controller starts and shuts down.
+
+    Overrides the lovely-pytest-docker fixture, which shuts the services down at the end of every worker session.
+    """
+    services = _compose_services(request.config, docker_ip)
+    yield services
+    if not _is_xdist_worker(request.config) and not request.config.getoption('--keepalive'):
+        services.shutdown()
+
+
 @pytest.fixture(scope='session')
-def stan_server(docker_services):
+def stan_server(pytestconfig, docker_services):  # pylint: disable=redefined-outer-name
     """Create the nats / stan services that the integration tests will use."""
-    docker_services.start('nats')
+    if not _is_xdist_worker(pytestconfig):
+        docker_services.start('nats')
     time.sleep(2)
 
 
 @pytest.fixture(scope='session')
-def minio_server(docker_services):
+def minio_server(app, pytestconfig, docker_services):  # pylint: disable=redefined-outer-name
     """Create the minio services that the integration tests will use."""
-    docker_services.start('minio')
+    if not _is_xdist_worker(pytestconfig):
+        docker_services.start('minio')
     with suppress(Exception):
         docker_services.wait_for_service('minio', 9000)
     time.sleep(10)
+
+    # docker-compose only creates the default bucket, pytest-xdist workers each use their own
+    if app.config.get('XDIST_WORKER'):
+        with app.app_context():
+            client = MinioService._get_client()  # pylint: disable=protected-access
+            bucket = app.config['MINIO_BUCKET_BUSINESSES']
+            if not client.bucket_exists(bucket):
+                client.make_bucket(bucket)
@@ -12,21 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Test Suite for all of the filing validations."""
+import json
+from collections import Counter
 from datetime import datetime, timedelta
 
+
 def lists_are_equal(list_1, list_2) -> bool:
     """Assert that the unordered lists contain the same elements."""
     if len(list_1) != len(list_2):
         return False
-    found = False
-    for i in list_1:
-        for j in list_2:
-            if i == j:
-                found = True
-                break
-            else:
-                found = False
-    return found
+
+    def counts(items):
+        # sorted key JSON is hashable and order-insensitive for nested messages as well
+        return Counter(json.dumps(item, sort_keys=True) for item in items)
+
+    return counts(list_1) == counts(list_2)
 
 
 def create_party(roles: list,
@@ -95,13 +95,13 @@ def create_party_address(base_address=None,
         party_address['addressRegion'] = region if region is not None else party_address['addressRegion']
     else:
         return {
-               'streetAddress': street,
-               'streetAddressAdditional': street_additional,
-               'addressCity': city,
-               'addressCountry': country,
-               'postalCode': postal_code,
-               'addressRegion': region
-           }
+            'streetAddress': street,
+            'streetAddressAdditional': street_additional,
+            'addressCity': city,
+            'addressCountry': country,
+            'postalCode': postal_code,
+            'addressRegion': region
+        }
 
     return party_address
 
@@ -112,14 +112,15 @@ def create_officer(base_officer=None,
                    last_name=None,
                    organization_name=None,
                    party_type=None):
+    """Create officer, overriding the properties of a base officer without modifying it."""
     if base_officer:
-        officer = base_officer
-        base_officer['firstName'] = first_name if first_name is not None else officer['firstName']
-        base_officer['middleName'] = middle_name if middle_name is not None else officer['middleName']
-        base_officer['lastName'] = last_name if last_name is not None else officer['lastName']
-        base_officer['organizationName'] = organization_name if organization_name is not None \
-                                            else officer['organizationName']
-        base_officer['partyType'] = party_type if party_type is not None else officer['partyType']
+        officer = dict(base_officer)
+        officer['firstName'] = first_name if first_name is not None else officer['firstName']
+        officer['middleName'] = middle_name if middle_name is not None else officer['middleName']
+        officer['lastName'] = last_name if last_name is not None else officer['lastName']
+        officer['organizationName'] = organization_name if organization_name is not None \
+            else officer['organizationName']
+        officer['partyType'] = party_type if party_type is not None else officer['partyType']
         return officer
     else:
         return {
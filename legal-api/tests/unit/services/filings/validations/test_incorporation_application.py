@@ -12,19 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Test suite to ensure the Incorporation Application is validated correctly."""
-import copy
 import io
+import json
+import os
+import uuid
 from datetime import date
+from functools import lru_cache
 from http import HTTPStatus
+from typing import Union
 
 import datedelta
 import pytest
-import requests
 from freezegun import freeze_time
 from registry_schemas.example_data import COOP_INCORPORATION, COURT_ORDER, INCORPORATION, INCORPORATION_FILING_TEMPLATE
 from registry_schemas.example_data.schema_data import FILING_HEADER
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 
 from legal_api.models import Business
 from legal_api.services import MinioService
@@ -37,6 +38,13 @@ from unittest.mock import patch
 from legal_api.services import NameXService
 from tests.unit import MockResponse
 
+# use orjson for cloning the templates when it is installed, it is a faster drop-in for these pure JSON structures
+try:
+    import orjson
+    _loads, _dumps = orjson.loads, orjson.dumps
+except ImportError:
+    _loads, _dumps = json.loads, json.dumps
+
 
 # setup
 identifier = 'NR 1234567'
@@ -48,199 +56,167 @@ effective_date = '2020-09-18T00:00:00+00:00'
 court_order_date = '2020-09-17T00:00:00+00:00'
 incorporation_application_name = 'incorporationApplication'
 validate_incorporation_agreement_path = 'legal_api.services.filings.validations.incorporation_application.validate_incorporation_agreement'
-
-nr_response = {
-    'state': 'APPROVED',
-    'expirationDate': '',
-    'names': [{
-        'name': legal_name,
-        'state': 'APPROVED',
-        'consumptionDate': ''
-    }]
-}
-
-
+validate_name_request_path = 'legal_api.services.filings.validations.incorporation_application.validate_name_request'
+validate_roles_path = 'legal_api.services.filings.validations.incorporation_application.validate_roles'
+
+# the party case tables are kept as JSON next to this module, which loads faster than the equivalent literals
+_CASES_PATH = os.path.join(os.path.dirname(__file__), 'test_incorporation_application_cases.json')
+with open(_CASES_PATH, encoding='utf-8') as cases_file:
+    _CASES = json.load(cases_file)
+
+# serialized once so each test can clone the (pure JSON) example data with _loads instead of copy.deepcopy,
+# these are bytes under orjson and str under json
+_TEMPLATE_JSON = _dumps(INCORPORATION_FILING_TEMPLATE)
+_INC_JSON = _dumps(INCORPORATION)
+_COOP_JSON = _dumps(COOP_INCORPORATION)
+_FILING_HEADER_JSON = _dumps(FILING_HEADER)
+# the serialized (bytes | str) incorporation application header used by every test,
+# cases that need one add the effectiveDate themselves
+_HEADER_JSON = _dumps({'name': incorporation_application_name, 'date': '2019-04-08', 'certifiedBy': 'full name',
+                       'email': 'no_one@never.get', 'filingId': 1})
+
+
+@pytest.fixture(scope='module')
+def prebuilt_filing_template():
+    """Return the incorporation filing header, without the application itself, serialized as bytes or str by _dumps."""
+    filing_json = _loads(_TEMPLATE_JSON)
+    filing_json['filing']['header'] = _loads(_HEADER_JSON)
+    filing_json['filing']['header']['effectiveDate'] = effective_date
+    del filing_json['filing'][incorporation_application_name]
+    return _dumps(filing_json)
+
+
+def _incorporation_overlay(legal_type, parties):
+    """Return the incorporation application as a shallow overlay on the shared INCORPORATION example.
+
+    Only the case specific keys are new objects, the rest are shared with INCORPORATION and must not be mutated.
+    """
+    overlay = {
+        'nameRequest': {'nrNumber': identifier, 'legalType': legal_type},
+        'contactPoint': {**INCORPORATION['contactPoint'], 'email': 'no_one@never.get', 'phone': '123-456-7890'},
+        'parties': parties
+    }
+    return {**INCORPORATION, **overlay}
+
+
+def _build_filing_json(filing_template: Union[bytes, str], legal_type: str, parties: list) -> dict:
+    """Return an incorporation filing for the legal type and parties from the serialized filing template."""
+    filing_json = _loads(filing_template)
+    filing_json['filing']['business']['legalType'] = legal_type
+    filing_json['filing'][incorporation_application_name] = _incorporation_overlay(legal_type, parties)
+    return filing_json
+
+
+@pytest.fixture
+def frozen_now():
+    """Freeze time at the module's reference date for the duration of a test."""
+    with freeze_time(now) as frozen:
+        yield frozen
+
+
+@pytest.fixture(scope='session')
+def valid_pdf_key(app, minio_server):
+    """Upload a valid letter-size PDF once per session and return its document key."""
+    with app.app_context():
+        return _upload_file(invalid=False)
+
+
+@pytest.fixture(scope='session')
+def invalid_pdf_key(app, minio_server):
+    """Upload a PDF with an invalid page size once per session and return its document key."""
+    with app.app_context():
+        return _upload_file(invalid=True)
+
+
+@pytest.fixture
+def stub_name_request(monkeypatch):
+    """Stub out the name request validation for tests that are not exercising it."""
+    monkeypatch.setattr(validate_name_request_path, lambda *args, **kwargs: [])
+
+
+@pytest.fixture
+def stub_roles(monkeypatch):
+    """Stub out the party roles validation for tests that are not exercising it."""
+    monkeypatch.setattr(validate_roles_path, lambda *args, **kwargs: [])
+
+
+@pytest.fixture
+def stub_agreement(monkeypatch):
+    """Stub out the incorporation agreement validation for tests that are not exercising it."""
+    monkeypatch.setattr(validate_incorporation_agreement_path, lambda *args, **kwargs: None)
+
+
+OFFICE_LEGAL_TYPES = [
+    Business.LegalTypes.BCOMP.value,
+    Business.LegalTypes.BC_ULC_COMPANY.value,
+    Business.LegalTypes.BC_CCC.value,
+    Business.LegalTypes.COMP.value
+]
+
+_REGION_ERROR = "Address Region must be 'BC'."
+_COUNTRY_ERROR = "Address Country must be 'CA'."
+_OFFICES_PATH = '/filing/incorporationApplication/offices'
+_ERR_REG_DEL_REGION = {'error': _REGION_ERROR,
+                       'path': f'{_OFFICES_PATH}/registeredOffice/deliveryAddress/addressRegion'}
+_ERR_REG_MAIL_REGION = {'error': _REGION_ERROR,
+                        'path': f'{_OFFICES_PATH}/registeredOffice/mailingAddress/addressRegion'}
+_ERR_REC_DEL_REGION = {'error': _REGION_ERROR,
+                       'path': f'{_OFFICES_PATH}/recordsOffice/deliveryAddress/addressRegion'}
+_ERR_REC_MAIL_REGION = {'error': _REGION_ERROR,
+                        'path': f'{_OFFICES_PATH}/recordsOffice/mailingAddress/addressRegion'}
+_ERR_REG_DEL_COUNTRY = {'error': _COUNTRY_ERROR,
+                        'path': f'{_OFFICES_PATH}/registeredOffice/deliveryAddress/addressCountry'}
+_ERR_REG_MAIL_COUNTRY = {'error': _COUNTRY_ERROR,
+                         'path': f'{_OFFICES_PATH}/registeredOffice/mailingAddress/addressCountry'}
+_ERR_REC_DEL_COUNTRY = {'error': _COUNTRY_ERROR,
+                        'path': f'{_OFFICES_PATH}/recordsOffice/deliveryAddress/addressCountry'}
+_ERR_REC_MAIL_COUNTRY = {'error': _COUNTRY_ERROR,
+                         'path': f'{_OFFICES_PATH}/recordsOffice/mailingAddress/addressCountry'}
+
+OFFICE_ADDRESS_SCENARIOS = [
+    ('SUCCESS', 'BC', 'CA', 'BC', 'CA', None, None),
+    ('FAIL_NOT_BC_DELIVERY_REGION', 'AB', 'CA', 'BC', 'CA',
+        HTTPStatus.BAD_REQUEST, [_ERR_REG_DEL_REGION, _ERR_REC_DEL_REGION]),
+    ('FAIL_NOT_BC_MAILING_REGION', 'BC', 'CA', 'AB', 'CA',
+        HTTPStatus.BAD_REQUEST, [_ERR_REG_MAIL_REGION, _ERR_REC_MAIL_REGION]),
+    ('FAIL_ALL_ADDRESS_REGIONS', 'WA', 'CA', 'WA', 'CA',
+        HTTPStatus.BAD_REQUEST, [_ERR_REG_DEL_REGION, _ERR_REG_MAIL_REGION,
+                                 _ERR_REC_DEL_REGION, _ERR_REC_MAIL_REGION]),
+    ('FAIL_NOT_DELIVERY_COUNTRY', 'BC', 'NZ', 'BC', 'CA',
+        HTTPStatus.BAD_REQUEST, [_ERR_REG_DEL_COUNTRY, _ERR_REC_DEL_COUNTRY]),
+    ('FAIL_NOT_MAILING_COUNTRY', 'BC', 'CA', 'BC', 'NZ',
+        HTTPStatus.BAD_REQUEST, [_ERR_REG_MAIL_COUNTRY, _ERR_REC_MAIL_COUNTRY]),
+    ('FAIL_ALL_ADDRESS', 'AB', 'NZ', 'AB', 'NZ',
+        HTTPStatus.BAD_REQUEST, [_ERR_REG_DEL_REGION, _ERR_REG_DEL_COUNTRY,
+                                 _ERR_REG_MAIL_REGION, _ERR_REG_MAIL_COUNTRY,
+                                 _ERR_REC_DEL_REGION, _ERR_REC_DEL_COUNTRY,
+                                 _ERR_REC_MAIL_REGION, _ERR_REC_MAIL_COUNTRY])
+]
+
+
+@pytest.mark.parametrize('legal_type', OFFICE_LEGAL_TYPES)
 @pytest.mark.parametrize(
-    'test_name, legal_type, delivery_region, delivery_country, mailing_region, mailing_country, expected_code, expected_msg',
-    [
-        ('SUCCESS', Business.LegalTypes.BCOMP.value, 'BC', 'CA', 'BC', 'CA', None, None),
-        ('SUCCESS', Business.LegalTypes.BC_ULC_COMPANY.value, 'BC', 'CA', 'BC', 'CA', None, None),
-        ('SUCCESS', Business.LegalTypes.BC_CCC.value, 'BC', 'CA', 'BC', 'CA', None, None),
-        ('SUCCESS', Business.LegalTypes.COMP.value, 'BC', 'CA', 'BC', 'CA', None, None),
-        ('FAIL_NOT_BC_DELIVERY_REGION', Business.LegalTypes.BCOMP.value, 'AB', 'CA', 'BC', 'CA',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Region must be 'BC'.",
-                 'path':
-                 '/filing/incorporationApplication/offices/registeredOffice/deliveryAddress/addressRegion'},
-                {'error': "Address Region must be 'BC'.",
-                    'path':
-                    '/filing/incorporationApplication/offices/recordsOffice/deliveryAddress/addressRegion'}
-            ]),
-        ('FAIL_NOT_BC_DELIVERY_REGION', Business.LegalTypes.BC_ULC_COMPANY.value, 'AB', 'CA', 'BC', 'CA',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Region must be 'BC'.",
-                 'path':
-                 '/filing/incorporationApplication/offices/registeredOffice/deliveryAddress/addressRegion'},
-                {'error': "Address Region must be 'BC'.",
-                    'path':
-                    '/filing/incorporationApplication/offices/recordsOffice/deliveryAddress/addressRegion'}
-            ]),
-        ('FAIL_NOT_BC_DELIVERY_REGION', Business.LegalTypes.COMP.value, 'AB', 'CA', 'BC', 'CA',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Region must be 'BC'.",
-                 'path':
-                 '/filing/incorporationApplication/offices/registeredOffice/deliveryAddress/addressRegion'},
-                {'error': "Address Region must be 'BC'.",
-                    'path':
-                    '/filing/incorporationApplication/offices/recordsOffice/deliveryAddress/addressRegion'}
-            ]),
-        ('FAIL_NOT_BC_DELIVERY_REGION', Business.LegalTypes.BC_CCC.value, 'AB', 'CA', 'BC', 'CA',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Region must be 'BC'.",
-                 'path':
-                 '/filing/incorporationApplication/offices/registeredOffice/deliveryAddress/addressRegion'},
-                {'error': "Address Region must be 'BC'.",
-                    'path':
-                    '/filing/incorporationApplication/offices/recordsOffice/deliveryAddress/addressRegion'}
-            ]),
-        ('FAIL_NOT_BC_MAILING_REGION', Business.LegalTypes.BCOMP.value, 'BC', 'CA', 'AB', 'CA',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Region must be 'BC'.",
-                 'path':
-                 '/filing/incorporationApplication/offices/registeredOffice/mailingAddress/addressRegion'},
-                {'error': "Address Region must be 'BC'.",
-                 'path':
-                 '/filing/incorporationApplication/offices/recordsOffice/mailingAddress/addressRegion'}
-            ]),
-        ('FAIL_NOT_BC_MAILING_REGION', Business.LegalTypes.BCOMP.value, 'BC', 'CA', 'AB', 'CA',
-         HTTPStatus.BAD_REQUEST, [
-             {'error': "Address Region must be 'BC'.",
-              'path':
-                  '/filing/incorporationApplication/offices/registeredOffice/mailingAddress/addressRegion'},
-             {'error': "Address Region must be 'BC'.",
-              'path':
-                  '/filing/incorporationApplication/offices/recordsOffice/mailingAddress/addressRegion'}
-         ]),
-        ('FAIL_NOT_BC_MAILING_REGION', Business.LegalTypes.COMP.value, 'BC', 'CA', 'AB', 'CA',
-         HTTPStatus.BAD_REQUEST, [
-             {'error': "Address Region must be 'BC'.",
-              'path':
-                  '/filing/incorporationApplication/offices/registeredOffice/mailingAddress/addressRegion'},
-             {'error': "Address Region must be 'BC'.",
-              'path':
-                  '/filing/incorporationApplication/offices/recordsOffice/mailingAddress/addressRegion'}
-         ]),
-        ('FAIL_NOT_BC_MAILING_REGION', Business.LegalTypes.BC_ULC_COMPANY.value, 'BC', 'CA', 'AB', 'CA',
-         HTTPStatus.BAD_REQUEST, [
-             {'error': "Address Region must be 'BC'.",
-              'path':
-                  '/filing/incorporationApplication/offices/registeredOffice/mailingAddress/addressRegion'},
-             {'error': "Address Region must be 'BC'.",
-              'path':
-                  '/filing/incorporationApplication/offices/recordsOffice/mailingAddress/addressRegion'}
-         ]),
-        ('FAIL_ALL_ADDRESS_REGIONS', Business.LegalTypes.BC_CCC.value, 'WA', 'CA', 'WA', 'CA',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Region must be 'BC'.",
-                 'path': '/filing/incorporationApplication/offices/registeredOffice/deliveryAddress/addressRegion'},
-                {'error': "Address Region must be 'BC'.",
-                 'path': '/filing/incorporationApplication/offices/registeredOffice/mailingAddress/addressRegion'},
-                {'error': "Address Region must be 'BC'.",
-                 'path': '/filing/incorporationApplication/offices/recordsOffice/deliveryAddress/addressRegion'},
-                {'error': "Address Region must be 'BC'.",
-                 'path': '/filing/incorporationApplication/offices/recordsOffice/mailingAddress/addressRegion'}
-            ]),
-        ('FAIL_NOT_DELIVERY_COUNTRY', Business.LegalTypes.BCOMP.value, 'BC', 'NZ', 'BC', 'CA',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/registeredOffice/deliveryAddress/addressCountry'},
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/recordsOffice/deliveryAddress/addressCountry'}
-            ]),
-        ('FAIL_NOT_DELIVERY_COUNTRY', Business.LegalTypes.COMP.value, 'BC', 'NZ', 'BC', 'CA',
-         HTTPStatus.BAD_REQUEST, [
-             {'error': "Address Country must be 'CA'.",
-              'path': '/filing/incorporationApplication/offices/registeredOffice/deliveryAddress/addressCountry'},
-             {'error': "Address Country must be 'CA'.",
-              'path': '/filing/incorporationApplication/offices/recordsOffice/deliveryAddress/addressCountry'}
-         ]),
-        ('FAIL_NOT_DELIVERY_COUNTRY', Business.LegalTypes.BC_ULC_COMPANY.value, 'BC', 'NZ', 'BC', 'CA',
-         HTTPStatus.BAD_REQUEST, [
-             {'error': "Address Country must be 'CA'.",
-              'path': '/filing/incorporationApplication/offices/registeredOffice/deliveryAddress/addressCountry'},
-             {'error': "Address Country must be 'CA'.",
-              'path': '/filing/incorporationApplication/offices/recordsOffice/deliveryAddress/addressCountry'}
-         ]),
-        ('FAIL_NOT_DELIVERY_COUNTRY', Business.LegalTypes.BC_CCC.value, 'BC', 'NZ', 'BC', 'CA',
-         HTTPStatus.BAD_REQUEST, [
-             {'error': "Address Country must be 'CA'.",
-              'path': '/filing/incorporationApplication/offices/registeredOffice/deliveryAddress/addressCountry'},
-             {'error': "Address Country must be 'CA'.",
-              'path': '/filing/incorporationApplication/offices/recordsOffice/deliveryAddress/addressCountry'}
-         ]),
-        ('FAIL_NOT_MAILING_COUNTRY', Business.LegalTypes.BCOMP.value, 'BC', 'CA', 'BC', 'NZ',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/registeredOffice/mailingAddress/addressCountry'},
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/recordsOffice/mailingAddress/addressCountry'}
-            ]),
-        ('FAIL_NOT_MAILING_COUNTRY', Business.LegalTypes.COMP.value, 'BC', 'CA', 'BC', 'NZ',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/registeredOffice/mailingAddress/addressCountry'},
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/recordsOffice/mailingAddress/addressCountry'}
-            ]),
-        ('FAIL_NOT_MAILING_COUNTRY', Business.LegalTypes.BC_ULC_COMPANY.value, 'BC', 'CA', 'BC', 'NZ',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/registeredOffice/mailingAddress/addressCountry'},
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/recordsOffice/mailingAddress/addressCountry'}
-            ]),
-        ('FAIL_NOT_MAILING_COUNTRY', Business.LegalTypes.BC_CCC.value, 'BC', 'CA', 'BC', 'NZ',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/registeredOffice/mailingAddress/addressCountry'},
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/recordsOffice/mailingAddress/addressCountry'}
-            ]),
-        ('FAIL_ALL_ADDRESS', Business.LegalTypes.BCOMP.value, 'AB', 'NZ', 'AB', 'NZ',
-            HTTPStatus.BAD_REQUEST, [
-                {'error': "Address Region must be 'BC'.",
-                 'path': '/filing/incorporationApplication/offices/registeredOffice/deliveryAddress/addressRegion'},
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/registeredOffice/deliveryAddress/addressCountry'},
-                {'error': "Address Region must be 'BC'.",
-                 'path': '/filing/incorporationApplication/offices/registeredOffice/mailingAddress/addressRegion'},
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/registeredOffice/mailingAddress/addressCountry'},
-                {'error': "Address Region must be 'BC'.",
-                 'path': '/filing/incorporationApplication/offices/recordsOffice/deliveryAddress/addressRegion'},
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/recordsOffice/deliveryAddress/addressCountry'},
-                {'error': "Address Region must be 'BC'.",
-                 'path': '/filing/incorporationApplication/offices/recordsOffice/mailingAddress/addressRegion'},
-                {'error': "Address Country must be 'CA'.",
-                 'path': '/filing/incorporationApplication/offices/recordsOffice/mailingAddress/addressCountry'}
-            ])
-    ])
-def test_validate_incorporation_addresses_basic(session, mocker, test_name, legal_type, delivery_region,
-                                                delivery_country, mailing_region, mailing_country, expected_code,
-                                                expected_msg):
+    'test_name, delivery_region, delivery_country, mailing_region, mailing_country, expected_code, expected_msg',
+    OFFICE_ADDRESS_SCENARIOS,
+    ids=[scenario[0] for scenario in OFFICE_ADDRESS_SCENARIOS])
+def test_validate_incorporation_addresses_basic(session, frozen_now, stub_name_request, stub_roles, stub_agreement,
+                                                test_name, legal_type,
+                                                delivery_region, delivery_country, mailing_region, mailing_country,
+                                                expected_code, expected_msg):
     """Assert that incorporation offices can be validated."""
-    filing_json = copy.deepcopy(INCORPORATION_FILING_TEMPLATE)
-    filing_json['filing']['header'] = {'name': incorporation_application_name, 'date': '2019-04-08',
-                                       'certifiedBy': 'full name', 'email': 'no_one@never.get', 'filingId': 1,
-                                       'effectiveDate': effective_date}
-
-    filing_json['filing'][incorporation_application_name] = copy.deepcopy(INCORPORATION)
-    filing_json['filing'][incorporation_application_name]['nameRequest'] = {}
-    filing_json['filing'][incorporation_application_name]['nameRequest']['nrNumber'] = identifier
-    filing_json['filing'][incorporation_application_name]['nameRequest']['legalType'] = legal_type
-    filing_json['filing'][incorporation_application_name]['contactPoint']['email'] = 'no_one@never.get'
-    filing_json['filing'][incorporation_application_name]['contactPoint']['phone'] = '123-456-7890'
+    filing_json = _loads(_TEMPLATE_JSON)
+    filing_json['filing']['header'] = _loads(_HEADER_JSON)
+    filing_json['filing']['header']['effectiveDate'] = effective_date
+
+    filing_json['filing'][incorporation_application_name] = _loads(_INC_JSON)
+    filing_json['filing'][incorporation_application_name]['nameRequest'] = {
+        'nrNumber': identifier,
+        'legalType': legal_type
+    }
+    filing_json['filing'][incorporation_application_name]['contactPoint'].update({
+        'email': 'no_one@never.get',
+        'phone': '123-456-7890'
+    })
 
     regoffice = filing_json['filing'][incorporation_application_name]['offices']['registeredOffice']
     regoffice['deliveryAddress']['addressRegion'] = delivery_region
@@ -254,17 +230,8 @@ def test_validate_incorporation_addresses_basic(session, mocker, test_name, lega
     recoffice['mailingAddress']['addressRegion'] = mailing_region
     recoffice['mailingAddress']['addressCountry'] = mailing_country
 
-    mocker.patch('legal_api.services.filings.validations.incorporation_application.validate_name_request',
-                 return_value=[])
-
-    mocker.patch('legal_api.services.filings.validations.incorporation_application.validate_roles',
-                 return_value=[])
-
-    mocker.patch(validate_incorporation_agreement_path, return_value=None)
-
     # perform test
-    with freeze_time(now):
-        err = validate(business, filing_json)
+    err = validate(business, filing_json)
 
     # validate outcomes
     if expected_code:
@@ -306,33 +273,35 @@ def test_validate_incorporation_addresses_basic(session, mocker, test_name, lega
          [{'error': 'Name Request legal type is not same as the business legal type.',
            'path': '/filing/incorporationApplication/nameRequest/legalType'}])
     ])
-def test_validate_name_request(session, mocker, test_name, legal_type, expected_code, expected_msg):
+def test_validate_name_request(session, frozen_now, stub_roles, stub_agreement, test_name, legal_type,
+                               expected_code, expected_msg):
     """Assert that incorporation name request can be validated."""
-    filing_json = copy.deepcopy(INCORPORATION_FILING_TEMPLATE)
-    filing_json['filing']['header'] = {'name': incorporation_application_name, 'date': '2019-04-08',
-                                       'certifiedBy': 'full name', 'email': 'no_one@never.get', 'filingId': 1,
-                                       'effectiveDate': effective_date}
-
-    filing_json['filing'][incorporation_application_name] = copy.deepcopy(INCORPORATION)
-    filing_json['filing'][incorporation_application_name]['nameRequest'] = {}
-    filing_json['filing'][incorporation_application_name]['nameRequest']['nrNumber'] = identifier
+    filing_json = _loads(_TEMPLATE_JSON)
+    filing_json['filing']['header'] = _loads(_HEADER_JSON)
+    filing_json['filing']['header']['effectiveDate'] = effective_date
+
+    filing_json['filing'][incorporation_application_name] = _loads(_INC_JSON)
     curr_legal_type = legal_type if test_name not in ['FAIL_LEGAL_TYPE_MISMATCH'] else 'CCC'
-    filing_json['filing'][incorporation_application_name]['nameRequest']['legalType'] = curr_legal_type
-    if test_name not in ['FAIL_LEGAL_NAME_MISMATCH']:
-        filing_json['filing'][incorporation_application_name]['nameRequest']['legalName'] = legal_name
-    else:
-        filing_json['filing'][incorporation_application_name]['nameRequest']['legalName'] = 'company name'
+    curr_legal_name = legal_name if test_name not in ['FAIL_LEGAL_NAME_MISMATCH'] else 'company name'
+    filing_json['filing'][incorporation_application_name]['nameRequest'] = {
+        'nrNumber': identifier,
+        'legalType': curr_legal_type,
+        'legalName': curr_legal_name
+    }
     filing_json['filing'][incorporation_application_name]['contactPoint']['phone'] = '123-456-7890'
-    nr_response_copy = copy.deepcopy(nr_response)
-    nr_response_copy['legalType'] = legal_type
-
-    mocker.patch('legal_api.services.filings.validations.incorporation_application.validate_roles',
-                 return_value=[])
-    mocker.patch(validate_incorporation_agreement_path, return_value=None)
-
-    with patch.object(NameXService, 'query_nr_number', return_value=MockResponse(nr_response_copy)):
-        with freeze_time(now):
-            err = validate(business, filing_json)
+    nr_response = {
+        'state': 'APPROVED',
+        'expirationDate': '',
+        'legalType': legal_type,
+        'names': [{
+            'name': legal_name,
+            'state': 'APPROVED',
+            'consumptionDate': ''
+        }]
+    }
+
+    with patch.object(NameXService, 'query_nr_number', return_value=MockResponse(nr_response)):
+        err = validate(business, filing_json)
     # validate outcomes
     if expected_code:
         assert err.code == expected_code
@@ -488,43 +457,44 @@ def test_validate_name_request(session, mocker, test_name, legal_type, expected_
                                       'path': '/filing/incorporationApplication/parties/roles'}]
         )
     ])
-def test_validate_incorporation_role(session, minio_server, mocker, test_name,
+def test_validate_incorporation_role(session, request, stub_name_request, stub_agreement, test_name,
                                      legal_type, parties, expected_code, expected_msg):
     """Assert that incorporation parties roles can be validated."""
-    filing_json = copy.deepcopy(INCORPORATION_FILING_TEMPLATE)
-    filing_json['filing']['header'] = {'name': incorporation_application_name, 'date': '2019-04-08', 'certifiedBy': 'full name',
-                                       'email': 'no_one@never.get', 'filingId': 1}
+    filing_json = _loads(_TEMPLATE_JSON)
+    filing_json['filing']['header'] = _loads(_HEADER_JSON)
     filing_json['filing']['business']['legalType'] = legal_type
 
     if legal_type == 'CP':
-        filing_json['filing'][incorporation_application_name] = copy.deepcopy(COOP_INCORPORATION)
-        # Provide mocked valid documents
-        filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = _upload_file(letter, invalid=False)
-        filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = _upload_file(letter, invalid=False)
+        filing_json['filing'][incorporation_application_name] = _loads(_COOP_JSON)
+        # Provide mocked valid documents, only CP cases need the minio server
+        valid_pdf_key = request.getfixturevalue('valid_pdf_key')
+        filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = valid_pdf_key
+        filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = valid_pdf_key
     else:
-        filing_json['filing'][incorporation_application_name] = copy.deepcopy(INCORPORATION)
+        filing_json['filing'][incorporation_application_name] = _loads(_INC_JSON)
 
-    filing_json['filing'][incorporation_application_name]['nameRequest'] = {}
-    filing_json['filing'][incorporation_application_name]['nameRequest']['nrNumber'] = identifier
-    filing_json['filing'][incorporation_application_name]['nameRequest']['legalType'] = legal_type
-    filing_json['filing'][incorporation_application_name]['contactPoint']['email'] = 'no_one@never.get'
-    filing_json['filing'][incorporation_application_name]['contactPoint']['phone'] = '123-456-7890'
+    filing_json['filing'][incorporation_application_name]['nameRequest'] = {
+        'nrNumber': identifier,
+        'legalType': legal_type
+    }
+    filing_json['filing'][incorporation_application_name]['contactPoint'].update({
+        'email': 'no_one@never.get',
+        'phone': '123-456-7890'
+    })
 
     base_mailing_address = filing_json['filing'][incorporation_application_name]['parties'][0]['mailingAddress']
     base_delivery_address = filing_json['filing'][incorporation_application_name]['parties'][0]['deliveryAddress']
     filing_json['filing'][incorporation_application_name]['parties'] = []
 
+    # create_party_address returns the base address itself, so every party shares the same instances
+    mailing_addr = create_party_address(base_address=base_mailing_address)
+    delivery_addr = create_party_address(base_address=base_delivery_address)
+
     # populate party and party role info
     for index, party in enumerate(parties):
-        mailing_addr = create_party_address(base_address=base_mailing_address)
-        delivery_addr = create_party_address(base_address=base_delivery_address)
         p = create_party(party['roles'], index + 1, mailing_addr, delivery_addr)
         filing_json['filing'][incorporation_application_name]['parties'].append(p)
 
-    mocker.patch('legal_api.services.filings.validations.incorporation_application.validate_name_request',
-                 return_value=[])
-    mocker.patch(validate_incorporation_agreement_path, return_value=None)
-
     # perform test
     err = validate(business, filing_json)
 
@@ -536,183 +506,10 @@ def test_validate_incorporation_role(session, minio_server, mocker, test_name,
         assert err is None
 
 
-@pytest.mark.parametrize(
-    'test_name, legal_type, parties, expected_msg',
-    [
-        ('SUCCESS', 'BEN',
-         [
-             {'partyName': 'officer1', 'roles': ['Director'],
-              'mailingAddress': {'street': '123 st', 'city': 'Vancouver', 'country': 'CA',
-                                 'postalCode': 'h0h0h0', 'region': 'BC'}}
-         ], None
-         ),
-        ('FAIL_INVALID_STREET', 'BEN',
-         [
-             {'partyName': 'officer1', 'roles': ['Director'],
-              'mailingAddress': {'street': None, 'city': 'Vancouver', 'country': 'CA',
-                                 'postalCode': 'h0h0h0', 'region': 'BC'}},
-         ], [{'error': 'Person 1: Mailing address streetAddress None is invalid',
-              'path': '/filing/incorporationApplication/parties/1/mailingAddress/streetAddress/None/'}]
-         ),
-        ('FAIL_INVALID_CITY', 'BEN',
-         [
-             {'partyName': 'officer1', 'roles': ['Director'],
-              'mailingAddress': {'street': '123 St', 'city': None, 'country': 'CA',
-                                 'postalCode': 'h0h0h0', 'region': 'BC'}},
-         ], [{'error': 'Person 1: Mailing address addressCity None is invalid',
-              'path': '/filing/incorporationApplication/parties/1/mailingAddress/addressCity/None/'}]
-         ),
-        ('FAIL_INVALID_COUNTRY', 'BEN',
-         [
-             {'partyName': 'officer1', 'roles': ['Director'],
-              'mailingAddress': {'street': '123 St', 'city': 'Vancouver', 'country': None,
-                                 'postalCode': 'h0h0h0', 'region': 'BC'}},
-         ], [{'error': 'Person 1: Mailing address addressCountry None is invalid',
-              'path': '/filing/incorporationApplication/parties/1/mailingAddress/addressCountry/None/'}]
-         ),
-        ('FAIL_INVALID_POSTAL_CODE', 'BEN',
-         [
-             {'partyName': 'officer1', 'roles': ['Director'],
-              'mailingAddress': {'street': '123 St', 'city': 'Vancouver', 'country': 'CA',
-                                 'postalCode': None, 'region': 'BC'}},
-         ], [{'error': 'Person 1: Mailing address postalCode None is invalid',
-              'path': '/filing/incorporationApplication/parties/1/mailingAddress/postalCode/None/'}]
-         ),
-        ('FAIL_INVALID_REGION', 'BEN',
-         [
-             {'partyName': 'officer1', 'roles': ['Director'],
-              'mailingAddress': {'street': '123 St', 'city': 'Vancouver', 'country': 'CA',
-                                 'postalCode': 'h0h0h0', 'region': None}},
-         ], [{'error': 'Person 1: Mailing address addressRegion None is invalid',
-              'path': '/filing/incorporationApplication/parties/1/mailingAddress/addressRegion/None/'}]
-         ),
-        ('SUCCESS', 'CP',
-         [
-             {
-                 'partyName': 'officer1', 'roles': ['Completing Party', 'Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'Vancouver', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'BC'}
-             },
-             {
-                 'partyName': 'officer2', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'Vancouver', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'AB'}
-             },
-             {
-                 'partyName': 'officer3', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'Vancouver', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'MB'}
-             },
-         ], None
-         ),
-        ('FAIL_ONE_IN_REGION_BC', 'CP',
-         [
-             {
-                 'partyName': 'officer1', 'roles': ['Completing Party', 'Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'asdf', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'AB'}
-             },
-             {
-                 'partyName': 'officer2', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'asdf', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'AB'}
-             },
-             {
-                 'partyName': 'officer3', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'asdfd', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'MB'}
-             },
-         ], [{'error': 'Must have minimum of one BC mailing address',
-              'path': '/filing/incorporationApplication/parties/mailingAddress'}]
-         ),
-        ('FAIL_MAJORITY_IN_COUNTRY_CA', 'CP',
-         [
-             {
-                 'partyName': 'officer1', 'roles': ['Completing Party', 'Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'asdf', 'country': 'US',
-                                    'postalCode': 'h0h0h0', 'region': 'AB'}
-             },
-             {
-                 'partyName': 'officer2', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'asdf', 'country': 'JP',
-                                    'postalCode': 'h0h0h0', 'region': 'AICHI'}
-             },
-             {
-                 'partyName': 'officer3', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'Vancouver', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'BC'}
-             }
-         ], [{'error': 'Must have majority of mailing addresses in Canada',
-              'path': '/filing/incorporationApplication/parties/mailingAddress'}]
-         ),
-        ('FAIL_MAJORITY_IN_COUNTRY_CA_50_percent', 'CP',
-         [
-             {
-                 'partyName': 'officer1', 'roles': ['Completing Party', 'Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'asdf', 'country': 'US',
-                                    'postalCode': 'h0h0h0', 'region': 'AB'}
-             },
-             {
-                 'partyName': 'officer2', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'asdf', 'country': 'JP',
-                                    'postalCode': 'h0h0h0', 'region': 'AICHI'}
-             },
-             {
-                 'partyName': 'officer3', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'Vancouver', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'BC'}
-             },
-             {
-                 'partyName': 'officer4', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'Vancouver', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'BC'}
-             }
-         ], [{'error': 'Must have majority of mailing addresses in Canada',
-              'path': '/filing/incorporationApplication/parties/mailingAddress'}]
-         ),
-        ('PASS_MAJORITY_IN_COUNTRY_CA', 'CP',
-         [
-             {
-                 'partyName': 'officer1', 'roles': ['Completing Party', 'Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'asdf', 'country': 'US',
-                                    'postalCode': 'h0h0h0', 'region': 'AB'}
-             },
-             {
-                 'partyName': 'officer2', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'Vancouver', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'BC'}
-             },
-             {
-                 'partyName': 'officer3', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'Vancouver', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'BC'}
-             },
-             {
-                 'partyName': 'officer4', 'roles': ['Director'],
-                 'mailingAddress': {'street': '123 st', 'city': 'Vancouver', 'country': 'CA',
-                                    'postalCode': 'h0h0h0', 'region': 'BC'}
-             }
-         ], None
-         )
-    ])
-def test_validate_incorporation_parties_mailing_address(session, mocker, test_name, legal_type, parties, expected_msg):
-    """Assert that incorporation parties mailing address is not empty."""
-    filing_json = copy.deepcopy(INCORPORATION_FILING_TEMPLATE)
-    filing_json['filing']['header'] = {'name': incorporation_application_name, 'date': '2019-04-08', 'certifiedBy': 'full name',
-                                       'email': 'no_one@never.get', 'filingId': 1, 'effectiveDate': effective_date}
-
-    filing_json['filing'][incorporation_application_name] = copy.deepcopy(INCORPORATION)
-    filing_json['filing']['business']['legalType'] = legal_type
-    filing_json['filing'][incorporation_application_name]['nameRequest'] = {}
-    filing_json['filing'][incorporation_application_name]['nameRequest']['nrNumber'] = identifier
-    filing_json['filing'][incorporation_application_name]['nameRequest']['legalType'] = legal_type
-    filing_json['filing'][incorporation_application_name]['contactPoint']['email'] = 'no_one@never.get'
-    filing_json['filing'][incorporation_application_name]['contactPoint']['phone'] = '123-456-7890'
-    filing_json['filing'][incorporation_application_name]['parties'] = []
-
-    # populate party and party role info
-    for index, party in enumerate(parties):
-
+def _build_mailing_parties(party_specs):
+    """Build the parties for a mailing address case from the party specs."""
+    parties = []
+    for index, party in enumerate(party_specs):
         party_ma = party['mailingAddress']
         mailing_addr = create_party_address(street=party_ma['street'],
                                             street_additional='street additional',
@@ -720,214 +517,60 @@ def test_validate_incorporation_parties_mailing_address(session, mocker, test_na
                                             country=party_ma['country'],
                                             postal_code=party_ma['postalCode'],
                                             region=party_ma['region'])
-        p = create_party(party['roles'], index + 1, mailing_addr, None)
-        filing_json['filing'][incorporation_application_name]['parties'].append(p)
+        parties.append(create_party(party['roles'], index + 1, mailing_addr, None))
+    return parties
+
+
+def _error_pairs(msg):
+    """Return the (error, path) pairs of a list of error dicts, sorted so unordered lists compare equal."""
+    if not msg:
+        return msg
+    return sorted((item['error'], item['path']) for item in msg)
 
-    mocker.patch('legal_api.services.filings.validations.incorporation_application.validate_name_request',
-                 return_value=[])
+
+def _expected_pairs(pairs):
+    """Return the expected [error, path] pairs of a case table as sorted tuples."""
+    if not pairs:
+        return pairs
+    return sorted(tuple(pair) for pair in pairs)
+
+
+PARTY_MAILING_ADDRESS_CASES = _CASES['mailing_address_cases']
+
+
+@pytest.mark.parametrize(
+    'legal_type, parties, expected_msg',
+    [(legal_type, _build_mailing_parties(party_specs), _expected_pairs(expected_msg))
+     for _, legal_type, party_specs, expected_msg in PARTY_MAILING_ADDRESS_CASES],
+    ids=[f'{test_name}-{legal_type}' for test_name, legal_type, *_ in PARTY_MAILING_ADDRESS_CASES])
+def test_validate_incorporation_parties_mailing_address(prebuilt_filing_template, frozen_now,
+                                                        legal_type, parties, expected_msg):
+    """Assert that incorporation parties mailing address is not empty."""
+    filing_json = _build_filing_json(prebuilt_filing_template, legal_type, list(parties))
 
     # perform test
-    with freeze_time(now):
-        err = validate_parties_mailing_address(filing_json, legal_type)
+    err = validate_parties_mailing_address(filing_json, legal_type)
 
     # validate outcomes
     if expected_msg:
-        assert lists_are_equal(err, expected_msg)
+        assert _error_pairs(err) == expected_msg
     else:
         assert err is None
 
 
+PARTY_NAME_CASES = _CASES['party_name_cases']
+
+
 @pytest.mark.parametrize(
-    'test_name, legal_type, parties, expected_msg',
-    [
-        (
-            'SUCCESS_VALID_FIRST_MIDDLE_NAME_LENGTHS', 'BEN',
-            [
-                {
-                    'partyName': 'officer1',
-                    'roles': ['Completing Party', 'Incorporator'],
-                    'officer': {'firstName': 'Johnajksdfjljdkslfja', 'middleName': None, 'lastName': 'Doe'}
-                },
-                {
-                    'partyName': 'officer2',
-                    'roles': ['Incorporator', 'Director'],
-                    'officer': {'firstName': 'Janeajksdfjljdkslfja', 'middleName': 'jkalsdf', 'lastName': 'Doe'}
-                }
-            ],
-            None
-        ),
-        (
-            'FAIL_PARTY_FIRST_NAME_TOO_LONG', 'BEN',
-            [
-                {
-                    'partyName': 'officer1',
-                    'roles': ['Completing Party', 'Incorporator'],
-                    'officer': {'firstName': 'Johnajksdfjljdkslfjab', 'middleName': None, 'lastName': 'Doe'}
-                },
-                {
-                    'partyName': 'officer2',
-                    'roles': ['Incorporator', 'Director'],
-                    'officer': {'firstName': 'Janeajksdfjljdkslfjab', 'middleName': 'jkalsdf', 'lastName': 'Doe'}
-                }
-            ],
-            [{'error': 'Completing Party, Incorporator first name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'},
-             {'error': 'Incorporator, Director first name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'}]
-        ),
-        (
-            'FAIL_PARTY_MIDDLE_NAME_TOO_LONG', 'BEN',
-            [
-                {
-                    'partyName': 'officer1',
-                    'roles': ['Completing Party', 'Incorporator'],
-                    'officer': {'firstName': 'John', 'middleName': 'Johnajksdfjljdkslfjab', 'lastName': 'Doe'}
-                },
-                {
-                    'partyName': 'officer2',
-                    'roles': ['Director'],
-                    'officer': {'firstName': 'Jane', 'middleName': 'Johnajksdfjljdkslfjab', 'lastName': 'Doe'}
-                }
-            ],
-            [{'error': 'Completing Party, Incorporator middle name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'},
-             {'error': 'Director middle name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'}]
-        ),
-        (
-            'FAIL_PARTY_FIRST_AND_MIDDLE_NAME_TOO_LONG', 'BEN',
-            [
-                {
-                    'partyName': 'officer1',
-                    'roles': ['Completing Party', 'Incorporator'],
-                    'officer': {'firstName': 'Janeajksdfjljdkslfjab', 'middleName': 'Janeajksdfjljdkslfjab', 'lastName': 'Doe'}
-                },
-            ],
-            [{'error': 'Completing Party, Incorporator first name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'},
-             {'error': 'Completing Party, Incorporator middle name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'}]
-        ),
-        (
-            'SUCCESS_VALID_FIRST_MIDDLE_NAME_LENGTHS', 'CP',
-            [
-                {
-                    'partyName': 'officer1',
-                    'roles': ['Completing Party', 'Director'],
-                    'officer': {'firstName': 'Johnajksdfjljdkslfja', 'middleName': None, 'lastName': 'Doe'}
-                },
-                {
-                    'partyName': 'officer2',
-                    'roles': ['Director'],
-                    'officer': {'firstName': 'Janeajksdfjljdkslfja', 'middleName': 'jkalsdf', 'lastName': 'Doe'}
-                },
-                {
-                    'partyName': 'officer3',
-                    'roles': ['Director'],
-                    'officer': {'firstName': 'Jane', 'middleName': None, 'lastName': 'Doe'}
-                }
-            ],
-            None
-        ),
-        (
-            'FAIL_PARTY_FIRST_NAME_TOO_LONG', 'CP',
-            [
-                {
-                    'partyName': 'officer1',
-                    'roles': ['Completing Party', 'Director'],
-                    'officer': {'firstName': 'Johnajksdfjljdkslfjab', 'middleName': None, 'lastName': 'Doe'}
-                },
-                {
-                    'partyName': 'officer2',
-                    'roles': ['Director'],
-                    'officer': {'firstName': 'Jane1jksdfjljdkslfjab', 'middleName': 'jkalsdf', 'lastName': 'Doe'}
-                },
-                {
-                    'partyName': 'officer3',
-                    'roles': ['Director'],
-                    'officer': {'firstName': 'Jane2jksdfjljdkslfjab', 'middleName': 'jkalsdf', 'lastName': 'Doe'}
-                }
-            ],
-            [{'error': 'Completing Party, Director first name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'},
-             {'error': 'Director first name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'},
-             {'error': 'Director first name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'}]
-        ),
-        (
-            'FAIL_PARTY_MIDDLE_NAME_TOO_LONG', 'CP',
-            [
-                {
-                    'partyName': 'officer1',
-                    'roles': ['Completing Party', 'Director'],
-                    'officer': {'firstName': 'John', 'middleName': 'Johnajksdfjljdkslfjab', 'lastName': 'Doe'}
-                },
-                {
-                    'partyName': 'officer2',
-                    'roles': ['Director'],
-                    'officer': {'firstName': 'Jane1', 'middleName': None, 'lastName': 'Doe'}
-                },
-                {
-                    'partyName': 'officer3',
-                    'roles': ['Director'],
-                    'officer': {'firstName': 'Jane2', 'middleName': 'Jane2ajksdfjljdkslfjab', 'lastName': 'Doe'}
-                }
-            ],
-            [{'error': 'Completing Party, Director middle name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'},
-             {'error': 'Director middle name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'}]
-        ),
-        (
-            'FAIL_PARTY_FIRST_AND_MIDDLE_NAME_TOO_LONG', 'CP',
-            [
-                {
-                    'partyName': 'officer1',
-                    'roles': ['Completing Party', 'Director'],
-                    'officer': {'firstName': 'Johnajksdfjljdkslfjab', 'middleName': 'Johnajksdfjljdkslfjab', 'lastName': 'Doe'}
-                },
-                {
-                    'partyName': 'officer2',
-                    'roles': ['Director'],
-                    'officer': {'firstName': 'Jane1jksdfjljdkslfjab', 'middleName': 'Jane1ajksdfjljdkslfjab', 'lastName': 'Doe'}
-                },
-                {
-                    'partyName': 'officer3',
-                    'roles': ['Director'],
-                    'officer': {'firstName': 'Jane2jksdfjljdkslfjab', 'middleName': 'Jane2ajksdfjljdkslfjab', 'lastName': 'Doe'}
-                }
-            ],
-            [{'error': 'Completing Party, Director first name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'},
-             {'error': 'Director first name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'},
-             {'error': 'Director first name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'},
-             {'error': 'Completing Party, Director middle name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'},
-             {'error': 'Director middle name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'},
-             {'error': 'Director middle name cannot be longer than 20 characters',
-              'path': '/filing/incorporationApplication/parties'}]
-        )
-    ])
-def test_validate_incorporation_party_names(session, mocker, test_name,
+    'legal_type, parties, expected_msg',
+    [(legal_type, parties, _expected_pairs(expected_msg)) for _, legal_type, parties, expected_msg in PARTY_NAME_CASES],
+    ids=[f'{test_name}-{legal_type}' for test_name, legal_type, *_ in PARTY_NAME_CASES])
+def test_validate_incorporation_party_names(prebuilt_filing_template, frozen_now,
                                             legal_type, parties, expected_msg):
     """Assert that incorporation parties roles can be validated."""
-    filing_json = copy.deepcopy(INCORPORATION_FILING_TEMPLATE)
-    filing_json['filing']['header'] = {'name': incorporation_application_name, 'date': '2019-04-08', 'certifiedBy': 'full name',
-                                       'email': 'no_one@never.get', 'filingId': 1, 'effectiveDate': effective_date}
+    filing_json = _build_filing_json(prebuilt_filing_template, legal_type, [])
 
-    filing_json['filing'][incorporation_application_name] = copy.deepcopy(INCORPORATION)
-    base_officer = filing_json['filing'][incorporation_application_name]['parties'][0]['officer']
-    filing_json['filing']['business']['legalType'] = legal_type
-    filing_json['filing'][incorporation_application_name]['nameRequest'] = {}
-    filing_json['filing'][incorporation_application_name]['nameRequest']['nrNumber'] = identifier
-    filing_json['filing'][incorporation_application_name]['nameRequest']['legalType'] = legal_type
-    filing_json['filing'][incorporation_application_name]['contactPoint']['email'] = 'no_one@never.get'
-    filing_json['filing'][incorporation_application_name]['contactPoint']['phone'] = '123-456-7890'
-    filing_json['filing'][incorporation_application_name]['parties'] = []
+    base_officer = INCORPORATION['parties'][0]['officer']
 
     # populate party and party role info
     for index, party in enumerate(parties):
@@ -936,284 +579,94 @@ def test_validate_incorporation_party_names(session, mocker, test_name,
         middle_name = officer['middleName']
         last_name = officer['lastName']
 
-        base_officer_copy = copy.deepcopy(base_officer)
-        officer = create_officer(base_officer=base_officer_copy,
+        officer = create_officer(base_officer=base_officer,
                                  first_name=first_name,
                                  middle_name=middle_name,
                                  last_name=last_name)
         p = create_party(roles=party['roles'], officer=officer)
         filing_json['filing'][incorporation_application_name]['parties'].append(p)
 
-    mocker.patch('legal_api.services.filings.validations.incorporation_application.validate_name_request',
-                 return_value=[])
-
     # perform test
-    with freeze_time(now):
-        err = validate_parties_names(filing_json, legal_type)
+    err = validate_parties_names(filing_json, legal_type)
 
     # validate outcomes
     if expected_msg:
-        assert lists_are_equal(err, expected_msg)
+        assert _error_pairs(err) == expected_msg
     else:
         assert err is None
 
 
-@pytest.mark.parametrize(
-    'test_name, legal_type,'
-    'class_name_1,class_has_max_shares,class_max_shares,has_par_value,par_value,currency,'
-    'series_name_1,series_has_max_shares,series_max_shares,'
-    'class_name_2,series_name_2,'
-    'expected_code, expected_msg',
-    [
-        ('SUCCESS', 'BEN', 'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None, None, None),
-        ('SUCCESS', 'BEN', 'Share Class 1', False, None, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None, None, None),
-        ('SUCCESS', 'BEN', 'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         None, None, None, None),
-        ('SUCCESS-CLASS2', 'BEN', 'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 2', None, None, None),
-        ('FAIL-CLASS2', 'BEN',
-         'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 1', None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 name already used in a share class or series.',
-             'path': '/filing/incorporationApplication/shareClasses/1/name/'
-         }]),
-        ('FAIL-SERIES2', 'BEN',
-         'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 2', 'Share Series 1',
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share series Share Series 1 name already used in a share class or series.',
-             'path': '/filing/incorporationApplication/shareClasses/0/series/1'
-         }]),
-        ('FAIL_INVALID_CLASS_MAX_SHARES', 'BEN',
-         'Share Class 1', True, None, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must provide value for maximum number of shares',
-             'path': '/filing/incorporationApplication/shareClasses/0/maxNumberOfShares/'
-         }]),
-        ('FAIL_INVALID_CURRENCY', 'BEN',
-         'Share Class 1', True, 5000, True, 0.875, None, 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must specify currency',
-             'path': '/filing/incorporationApplication/shareClasses/0/currency/'
-         }]),
-        ('FAIL_INVALID_PAR_VALUE', 'BEN',
-         'Share Class 1', True, 5000, True, None, 'CAD', 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must specify par value',
-             'path': '/filing/incorporationApplication/shareClasses/0/parValue/'
-         }]),
-        ('FAIL_INVALID_SERIES_MAX_SHARES', 'BEN',
-         'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, None,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share series Share Series 1 must provide value for maximum number of shares',
-             'path': '/filing/incorporationApplication/shareClasses/0/series/0/maxNumberOfShares'
-         }]),
-        ('FAIL_SERIES_SHARES_EXCEEDS_CLASS_SHARES', 'BEN',
-         'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, 10000,
-         None, None,
-            HTTPStatus.BAD_REQUEST, [{
-                'error':
-                'Series Share Series 1 share quantity must be less than or equal to that of its class Share Class 1',
-                'path': '/filing/incorporationApplication/shareClasses/0/series/0/maxNumberOfShares'
-            }]),
-        ('SUCCESS', 'BC', 'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None, None, None),
-        ('SUCCESS', 'BC', 'Share Class 1', False, None, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None, None, None),
-        ('SUCCESS', 'BC', 'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         None, None, None, None),
-        ('SUCCESS-CLASS2', 'BC', 'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 2', None, None, None),
-        ('FAIL-CLASS2', 'BC',
-         'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 1', None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 name already used in a share class or series.',
-             'path': '/filing/incorporationApplication/shareClasses/1/name/'
-         }]),
-        ('FAIL-SERIES2', 'BC',
-         'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 2', 'Share Series 1',
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share series Share Series 1 name already used in a share class or series.',
-             'path': '/filing/incorporationApplication/shareClasses/0/series/1'
-         }]),
-        ('FAIL_INVALID_CLASS_MAX_SHARES', 'BC',
-         'Share Class 1', True, None, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must provide value for maximum number of shares',
-             'path': '/filing/incorporationApplication/shareClasses/0/maxNumberOfShares/'
-         }]),
-        ('FAIL_INVALID_CURRENCY', 'BC',
-         'Share Class 1', True, 5000, True, 0.875, None, 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must specify currency',
-             'path': '/filing/incorporationApplication/shareClasses/0/currency/'
-         }]),
-        ('FAIL_INVALID_PAR_VALUE', 'BC',
-         'Share Class 1', True, 5000, True, None, 'CAD', 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must specify par value',
-             'path': '/filing/incorporationApplication/shareClasses/0/parValue/'
-         }]),
-        ('FAIL_INVALID_SERIES_MAX_SHARES', 'BC',
-         'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, None,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share series Share Series 1 must provide value for maximum number of shares',
-             'path': '/filing/incorporationApplication/shareClasses/0/series/0/maxNumberOfShares'
-         }]),
-        ('FAIL_SERIES_SHARES_EXCEEDS_CLASS_SHARES', 'BC',
-         'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, 10000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error':
-             'Series Share Series 1 share quantity must be less than or equal to that of its class Share Class 1',
-             'path': '/filing/incorporationApplication/shareClasses/0/series/0/maxNumberOfShares'
-         }]),
-        ('SUCCESS', 'ULC', 'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None, None, None),
-        ('SUCCESS', 'ULC', 'Share Class 1', False, None, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None, None, None),
-        ('SUCCESS', 'ULC', 'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         None, None, None, None),
-        ('SUCCESS-CLASS2', 'ULC', 'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 2', None, None, None),
-        ('FAIL-CLASS2', 'ULC',
-         'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 1', None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 name already used in a share class or series.',
-             'path': '/filing/incorporationApplication/shareClasses/1/name/'
-         }]),
-        ('FAIL-SERIES2', 'ULC',
-         'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 2', 'Share Series 1',
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share series Share Series 1 name already used in a share class or series.',
-             'path': '/filing/incorporationApplication/shareClasses/0/series/1'
-         }]),
-        ('FAIL_INVALID_CLASS_MAX_SHARES', 'ULC',
-         'Share Class 1', True, None, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must provide value for maximum number of shares',
-             'path': '/filing/incorporationApplication/shareClasses/0/maxNumberOfShares/'
-         }]),
-        ('FAIL_INVALID_CURRENCY', 'ULC',
-         'Share Class 1', True, 5000, True, 0.875, None, 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must specify currency',
-             'path': '/filing/incorporationApplication/shareClasses/0/currency/'
-         }]),
-        ('FAIL_INVALID_PAR_VALUE', 'ULC',
-         'Share Class 1', True, 5000, True, None, 'CAD', 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must specify par value',
-             'path': '/filing/incorporationApplication/shareClasses/0/parValue/'
-         }]),
-        ('FAIL_INVALID_SERIES_MAX_SHARES', 'ULC',
-         'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, None,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share series Share Series 1 must provide value for maximum number of shares',
-             'path': '/filing/incorporationApplication/shareClasses/0/series/0/maxNumberOfShares'
-         }]),
-        ('FAIL_SERIES_SHARES_EXCEEDS_CLASS_SHARES', 'ULC',
-         'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, 10000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error':
-             'Series Share Series 1 share quantity must be less than or equal to that of its class Share Class 1',
-             'path': '/filing/incorporationApplication/shareClasses/0/series/0/maxNumberOfShares'
-         }]),
-        ('SUCCESS', 'CC', 'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None, None, None),
-        ('SUCCESS', 'CC', 'Share Class 1', False, None, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None, None, None),
-        ('SUCCESS', 'CC', 'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         None, None, None, None),
-        ('SUCCESS-CLASS2', 'CC', 'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 2', None, None, None),
-        ('FAIL-CLASS2', 'CC',
-         'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 1', None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 name already used in a share class or series.',
-             'path': '/filing/incorporationApplication/shareClasses/1/name/'
-         }]),
-        ('FAIL-SERIES2', 'CC',
-         'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
-         'Share Class 2', 'Share Series 1',
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share series Share Series 1 name already used in a share class or series.',
-             'path': '/filing/incorporationApplication/shareClasses/0/series/1'
-         }]),
-        ('FAIL_INVALID_CLASS_MAX_SHARES', 'CC',
-         'Share Class 1', True, None, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must provide value for maximum number of shares',
-             'path': '/filing/incorporationApplication/shareClasses/0/maxNumberOfShares/'
-         }]),
-        ('FAIL_INVALID_CURRENCY', 'CC',
-         'Share Class 1', True, 5000, True, 0.875, None, 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must specify currency',
-             'path': '/filing/incorporationApplication/shareClasses/0/currency/'
-         }]),
-        ('FAIL_INVALID_PAR_VALUE', 'CC',
-         'Share Class 1', True, 5000, True, None, 'CAD', 'Share Series 1', True, 1000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share class Share Class 1 must specify par value',
-             'path': '/filing/incorporationApplication/shareClasses/0/parValue/'
-         }]),
-        ('FAIL_INVALID_SERIES_MAX_SHARES', 'CC',
-         'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, None,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error': 'Share series Share Series 1 must provide value for maximum number of shares',
-             'path': '/filing/incorporationApplication/shareClasses/0/series/0/maxNumberOfShares'
-         }]),
-        ('FAIL_SERIES_SHARES_EXCEEDS_CLASS_SHARES', 'CC',
-         'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, 10000,
-         None, None,
-         HTTPStatus.BAD_REQUEST, [{
-             'error':
-             'Series Share Series 1 share quantity must be less than or equal to that of its class Share Class 1',
-             'path': '/filing/incorporationApplication/shareClasses/0/series/0/maxNumberOfShares'
-         }])
-    ])
-def test_validate_incorporation_share_classes(session, mocker, test_name, legal_type,
-                                              class_name_1, class_has_max_shares, class_max_shares,
-                                              has_par_value, par_value, currency, series_name_1, series_has_max_shares,
-                                              series_max_shares,
-                                              class_name_2, series_name_2,
-                                              expected_code, expected_msg):
-    """Assert that validator validates share class correctly."""
-    filing_json = copy.deepcopy(INCORPORATION_FILING_TEMPLATE)
-    filing_json['filing']['header'] = {'name': incorporation_application_name, 'date': '2019-04-08', 'certifiedBy': 'full name',
-                                       'email': 'no_one@never.get', 'filingId': 1, 'effectiveDate': effective_date}
-
-    filing_json['filing'][incorporation_application_name] = copy.deepcopy(INCORPORATION)
-    filing_json['filing'][incorporation_application_name]['nameRequest'] = {}
-    filing_json['filing'][incorporation_application_name]['nameRequest']['nrNumber'] = 'NR 1234567'
-    filing_json['filing'][incorporation_application_name]['nameRequest']['legalType'] = legal_type
-    filing_json['filing']['business']['legalType'] = legal_type
+SHARE_CLASS_LEGAL_TYPES = ['BEN', 'BC', 'ULC', 'CC']
+
+SHARE_CLASS_SCENARIOS = [
+    ('SUCCESS', 'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
+     None, None, None, None),
+    ('SUCCESS', 'Share Class 1', False, None, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
+     None, None, None, None),
+    ('SUCCESS', 'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
+     None, None, None, None),
+    ('SUCCESS-CLASS2', 'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
+     'Share Class 2', None, None, None),
+    ('FAIL-CLASS2',
+     'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
+     'Share Class 1', None,
+     HTTPStatus.BAD_REQUEST, [{
+         'error': 'Share class Share Class 1 name already used in a share class or series.',
+         'path': '/filing/incorporationApplication/shareClasses/1/name/'
+     }]),
+    ('FAIL-SERIES2',
+     'Share Class 1', False, None, False, None, None, 'Share Series 1', False, None,
+     'Share Class 2', 'Share Series 1',
+     HTTPStatus.BAD_REQUEST, [{
+         'error': 'Share series Share Series 1 name already used in a share class or series.',
+         'path': '/filing/incorporationApplication/shareClasses/0/series/1'
+     }]),
+    ('FAIL_INVALID_CLASS_MAX_SHARES',
+     'Share Class 1', True, None, True, 0.875, 'CAD', 'Share Series 1', True, 1000,
+     None, None,
+     HTTPStatus.BAD_REQUEST, [{
+         'error': 'Share class Share Class 1 must provide value for maximum number of shares',
+         'path': '/filing/incorporationApplication/shareClasses/0/maxNumberOfShares/'
+     }]),
+    ('FAIL_INVALID_CURRENCY',
+     'Share Class 1', True, 5000, True, 0.875, None, 'Share Series 1', True, 1000,
+     None, None,
+     HTTPStatus.BAD_REQUEST, [{
+         'error': 'Share class Share Class 1 must specify currency',
+         'path': '/filing/incorporationApplication/shareClasses/0/currency/'
+     }]),
+    ('FAIL_INVALID_PAR_VALUE',
+     'Share Class 1', True, 5000, True, None, 'CAD', 'Share Series 1', True, 1000,
+     None, None,
+     HTTPStatus.BAD_REQUEST, [{
+         'error': 'Share class Share Class 1 must specify par value',
+         'path': '/filing/incorporationApplication/shareClasses/0/parValue/'
+     }]),
+    ('FAIL_INVALID_SERIES_MAX_SHARES',
+     'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, None,
+     None, None,
+     HTTPStatus.BAD_REQUEST, [{
+         'error': 'Share series Share Series 1 must provide value for maximum number of shares',
+         'path': '/filing/incorporationApplication/shareClasses/0/series/0/maxNumberOfShares'
+     }]),
+    ('FAIL_SERIES_SHARES_EXCEEDS_CLASS_SHARES',
+     'Share Class 1', True, 5000, True, 0.875, 'CAD', 'Share Series 1', True, 10000,
+     None, None,
+     HTTPStatus.BAD_REQUEST, [{
+         'error':
+         'Series Share Series 1 share quantity must be less than or equal to that of its class Share Class 1',
+         'path': '/filing/incorporationApplication/shareClasses/0/series/0/maxNumberOfShares'
+     }])
+]
+
+
+def _build_share_class_filing():
+    """Return the serialized filing shared by the share class cases, with its parties already populated."""
+    filing_json = _loads(_TEMPLATE_JSON)
+    filing_json['filing']['header'] = _loads(_HEADER_JSON)
+    filing_json['filing']['header']['effectiveDate'] = effective_date
+
+    filing_json['filing'][incorporation_application_name] = _loads(_INC_JSON)
 
     base_mailing_address = filing_json['filing'][incorporation_application_name]['parties'][0]['mailingAddress']
     base_delivery_address = filing_json['filing'][incorporation_application_name]['parties'][0]['deliveryAddress']
@@ -1232,6 +685,34 @@ def test_validate_incorporation_share_classes(session, mocker, test_name, legal_
         p = create_party(party['roles'], index + 1, mailing_addr, delivery_addr)
         filing_json['filing'][incorporation_application_name]['parties'].append(p)
 
+    return _dumps(filing_json)
+
+
+# the share class cases only differ in the legal type and share structure, so the rest is built once
+_SHARE_CLASS_FILING_JSON = _build_share_class_filing()
+
+
+@pytest.mark.parametrize(
+    'test_name, legal_type,'
+    'class_name_1,class_has_max_shares,class_max_shares,has_par_value,par_value,currency,'
+    'series_name_1,series_has_max_shares,series_max_shares,'
+    'class_name_2,series_name_2,'
+    'expected_code, expected_msg',
+    [(case[0], legal_type, *case[1:]) for legal_type in SHARE_CLASS_LEGAL_TYPES for case in SHARE_CLASS_SCENARIOS])
+def test_validate_incorporation_share_classes(session, frozen_now, stub_name_request, stub_agreement, test_name,
+                                              legal_type, class_name_1, class_has_max_shares, class_max_shares,
+                                              has_par_value, par_value, currency, series_name_1, series_has_max_shares,
+                                              series_max_shares,
+                                              class_name_2, series_name_2,
+                                              expected_code, expected_msg):
+    """Assert that validator validates share class correctly."""
+    filing_json = _loads(_SHARE_CLASS_FILING_JSON)
+    filing_json['filing'][incorporation_application_name]['nameRequest'] = {
+        'nrNumber': 'NR 1234567',
+        'legalType': legal_type
+    }
+    filing_json['filing']['business']['legalType'] = legal_type
+
     share_structure = filing_json['filing'][incorporation_application_name]['shareStructure']
 
     share_structure['shareClasses'][0]['name'] = class_name_1
@@ -1252,13 +733,8 @@ def test_validate_incorporation_share_classes(session, mocker, test_name, legal_
         # set 1st shareClass, 2nd series name
         share_structure['shareClasses'][0]['series'][1]['name'] = series_name_2
 
-    mocker.patch('legal_api.services.filings.validations.incorporation_application.validate_name_request',
-                 return_value=[])
-    mocker.patch(validate_incorporation_agreement_path, return_value=None)
-
     # perform test
-    with freeze_time(now):
-        err = validate(business, filing_json)
+    err = validate(business, filing_json)
 
     # validate outcomes
     if expected_code:
@@ -1287,24 +763,20 @@ def test_validate_incorporation_share_classes(session, mocker, test_name, legal_
             }])
     ])
 @not_github_ci
-def test_validate_incorporation_effective_date(session, mocker, test_name, effective_date, expected_code, expected_msg):
+def test_validate_incorporation_effective_date(session, frozen_now, stub_name_request, test_name, effective_date,
+                                               expected_code, expected_msg):
     """Assert that validator validates share class correctly."""
-    filing_json = copy.deepcopy(FILING_HEADER)
+    filing_json = _loads(_FILING_HEADER_JSON)
     filing_json['filing'].pop('business')
-    filing_json['filing']['header'] = {'name': incorporation_application_name, 'date': '2019-04-08', 'certifiedBy': 'full name',
-                                       'email': 'no_one@never.get', 'filingId': 1}
+    filing_json['filing']['header'] = _loads(_HEADER_JSON)
 
     if effective_date is not None:
         filing_json['filing']['header']['effectiveDate'] = effective_date
 
-    filing_json['filing'][incorporation_application_name] = copy.deepcopy(INCORPORATION)
-
-    mocker.patch('legal_api.services.filings.validations.incorporation_application.validate_name_request',
-                 return_value=[])
+    filing_json['filing'][incorporation_application_name] = _loads(_INC_JSON)
 
     # perform test
-    with freeze_time(now):
-        err = validate(business, filing_json)
+    err = validate(business, filing_json)
 
     # validate outcomes
     if expected_code:
@@ -1316,6 +788,20 @@ def test_validate_incorporation_effective_date(session, mocker, test_name, effec
         assert err is None
 
 
+def _build_cooperative_filing():
+    """Return a cooperative incorporation filing that meets the minimum director requirements."""
+    filing_json = _loads(_TEMPLATE_JSON)
+    filing_json['filing']['header'] = _loads(_HEADER_JSON)
+    filing_json['filing']['business']['legalType'] = 'CP'
+    filing_json['filing'][incorporation_application_name] = _loads(_COOP_JSON)
+
+    # Add minimum director requirements
+    director = filing_json['filing'][incorporation_application_name]['parties'][0]['roles'][1]
+    filing_json['filing'][incorporation_application_name]['parties'][0]['roles'].append(director)
+    filing_json['filing'][incorporation_application_name]['parties'][0]['roles'].append(director)
+    return filing_json
+
+
 @pytest.mark.parametrize(
     'test_name, key, scenario, expected_code, expected_msg',
     [
@@ -1329,22 +815,6 @@ def test_validate_incorporation_effective_date(session, mocker, test_name, effec
             HTTPStatus.BAD_REQUEST, [{
                 'error': 'Invalid file.'
             }]),
-        ('FAIL_INVALID_RULES_KEY', 'rulesFileKey', '',
-            HTTPStatus.BAD_REQUEST, [{
-                'error': 'A valid rules key is required.'
-            }]),
-        ('FAIL_INVALID_RULES_NAME', 'rulesFileName', '',
-            HTTPStatus.BAD_REQUEST, [{
-                'error': 'A valid rules file name is required.'
-            }]),
-        ('FAIL_INVALID_MEMORANDUM_KEY', 'memorandumFileKey', '',
-            HTTPStatus.BAD_REQUEST, [{
-                'error': 'A valid memorandum key is required.'
-            }]),
-        ('FAIL_INVALID_MEMORANDUM_NAME', 'memorandumFileName', '',
-            HTTPStatus.BAD_REQUEST, [{
-                'error': 'A valid memorandum file name is required.'
-            }]),
         ('FAIL_INVALID_RULES_FILE_KEY', 'rulesFileKey', 'invalidRulesSize',
             HTTPStatus.BAD_REQUEST, [{
                 'error': 'Document must be set to fit onto 8.5” x 11” letter-size paper.'
@@ -1354,44 +824,27 @@ def test_validate_incorporation_effective_date(session, mocker, test_name, effec
                 'error': 'Document must be set to fit onto 8.5” x 11” letter-size paper.'
             }]),
     ])
-def test_validate_cooperative_documents(session, mocker, minio_server, test_name, key, scenario, expected_code,
-                                        expected_msg):
+def test_validate_cooperative_documents(session, stub_name_request, valid_pdf_key, invalid_pdf_key, test_name, key,
+                                        scenario, expected_code, expected_msg):
     """Assert that validator validates cooperative documents correctly."""
-    filing_json = copy.deepcopy(INCORPORATION_FILING_TEMPLATE)
-    filing_json['filing']['header'] = {'name': incorporation_application_name, 'date': '2019-04-08', 'certifiedBy': 'full name',
-                                       'email': 'no_one@never.get', 'filingId': 1}
-    filing_json['filing']['business']['legalType'] = 'CP'
-    filing_json['filing'][incorporation_application_name] = copy.deepcopy(COOP_INCORPORATION)
-
-    # Add minimum director requirements
-    director = filing_json['filing'][incorporation_application_name]['parties'][0]['roles'][1]
-    filing_json['filing'][incorporation_application_name]['parties'][0]['roles'].append(director)
-    filing_json['filing'][incorporation_application_name]['parties'][0]['roles'].append(director)
+    filing_json = _build_cooperative_filing()
 
     # Mock upload file for test scenarios
-    if scenario:
-        if scenario == 'success':
-            filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = _upload_file(letter, invalid=False)
-            filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = _upload_file(letter, invalid=False)
-        if scenario == 'failRules':
-            filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = scenario
-            filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = _upload_file(letter, invalid=False)
-        if scenario == 'failMemorandum':
-            filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = _upload_file(letter, invalid=False)
-            filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = scenario
-        if scenario == 'invalidRulesSize':
-            filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = _upload_file(letter, invalid=True)
-            filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = _upload_file(letter, invalid=False)
-        if scenario == 'invalidMemorandumSize':
-            filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = _upload_file(letter, invalid=False)
-            filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = _upload_file(letter, invalid=True)
-    else:
-        # Assign key and value to test empty variables for failures
-        key_value = ''
-        filing_json['filing'][incorporation_application_name]['cooperative'][key] = key_value
-
-    mocker.patch('legal_api.services.filings.validations.incorporation_application.validate_name_request',
-                 return_value=[])
+    if scenario == 'success':
+        filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = valid_pdf_key
+        filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = valid_pdf_key
+    if scenario == 'failRules':
+        filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = scenario
+        filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = valid_pdf_key
+    if scenario == 'failMemorandum':
+        filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = valid_pdf_key
+        filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = scenario
+    if scenario == 'invalidRulesSize':
+        filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = invalid_pdf_key
+        filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = valid_pdf_key
+    if scenario == 'invalidMemorandumSize':
+        filing_json['filing'][incorporation_application_name]['cooperative']['rulesFileKey'] = valid_pdf_key
+        filing_json['filing'][incorporation_application_name]['cooperative']['memorandumFileKey'] = invalid_pdf_key
 
     # perform test
     err = validate(business, filing_json)
@@ -1404,6 +857,30 @@ def test_validate_cooperative_documents(session, mocker, minio_server, test_name
         assert err is None
 
 
+@pytest.mark.parametrize(
+    'test_name, key, expected_msg',
+    [
+        ('FAIL_INVALID_RULES_KEY', 'rulesFileKey', [{'error': 'A valid rules key is required.'}]),
+        ('FAIL_INVALID_RULES_NAME', 'rulesFileName', [{'error': 'A valid rules file name is required.'}]),
+        ('FAIL_INVALID_MEMORANDUM_KEY', 'memorandumFileKey', [{'error': 'A valid memorandum key is required.'}]),
+        ('FAIL_INVALID_MEMORANDUM_NAME', 'memorandumFileName',
+            [{'error': 'A valid memorandum file name is required.'}]),
+    ])
+def test_validate_cooperative_documents_missing_keys(session, stub_name_request, test_name, key, expected_msg):
+    """Assert that missing cooperative document keys and names are rejected before the documents are fetched."""
+    filing_json = _build_cooperative_filing()
+
+    # Assign key and value to test empty variables for failures
+    filing_json['filing'][incorporation_application_name]['cooperative'][key] = ''
+
+    # perform test
+    err = validate(business, filing_json)
+
+    # validate outcomes
+    assert err.code == HTTPStatus.BAD_REQUEST
+    assert lists_are_equal(err.msg, expected_msg)
+
+
 @pytest.mark.parametrize(
     'legal_type, expected_code, expected_msg', [
         ('BEN', HTTPStatus.BAD_REQUEST, '(BEN) incorporationApplication does not support court order.'),
@@ -1411,25 +888,19 @@ def test_validate_cooperative_documents(session, mocker, minio_server, test_name
         ('CC', HTTPStatus.BAD_REQUEST, '(CC) incorporationApplication does not support court order.'),
         ('ULC', None, None),
     ])
-def test_ia_court_order(session, mocker, legal_type, expected_code, expected_msg):
+def test_ia_court_order(session, frozen_now, stub_roles, stub_agreement, legal_type, expected_code, expected_msg):
     """Assert that incorporation court order can be validated."""
-    filing_json = copy.deepcopy(INCORPORATION_FILING_TEMPLATE)
-    filing_json['filing']['header'] = {'name': incorporation_application_name, 'date': '2019-04-08',
-                                       'certifiedBy': 'full name', 'email': 'no_one@never.get', 'filingId': 1,
-                                       'effectiveDate': effective_date}
+    filing_json = _loads(_TEMPLATE_JSON)
+    filing_json['filing']['header'] = _loads(_HEADER_JSON)
+    filing_json['filing']['header']['effectiveDate'] = effective_date
 
-    filing_json['filing'][incorporation_application_name] = copy.deepcopy(INCORPORATION)
+    filing_json['filing'][incorporation_application_name] = _loads(_INC_JSON)
     filing_json['filing'][incorporation_application_name]['nameRequest']['legalType'] = legal_type
     filing_json['filing'][incorporation_application_name]['courtOrder'] = COURT_ORDER
     filing_json['filing'][incorporation_application_name]['courtOrder']['orderDate'] = court_order_date
 
-    mocker.patch('legal_api.services.filings.validations.incorporation_application.validate_roles',
-                 return_value=[])
-    mocker.patch(validate_incorporation_agreement_path, return_value=None)
-
     # perform test
-    with freeze_time(now):
-        err = validate(None, filing_json)
+    err = validate(None, filing_json)
 
     if expected_code:
         assert err.code == expected_code
@@ -1441,19 +912,23 @@ def test_ia_court_order(session, mocker, legal_type, expected_code, expected_msg
         assert err is None
 
 
-def _upload_file(page_size, invalid):
-    signed_url = MinioService.create_signed_put_url('cooperative-test.pdf')
-    key = signed_url.get('key')
-    pre_signed_put = signed_url.get('preSignedUrl')
-
-    requests.put(pre_signed_put, data=_create_pdf_file(page_size, invalid).read(),
-                 headers={'Content-Type': 'application/octet-stream'})
+def _upload_file(page_size=None, invalid=False):
+    """Put a test PDF straight into the document bucket and return its key."""
+    key = f'{uuid.uuid4()}.pdf'
+    pdf_file = _create_pdf_file(page_size, invalid)
+    MinioService.put_file(key, io.BytesIO(pdf_file), len(pdf_file))
     return key
 
 
+@lru_cache(maxsize=None)
 def _create_pdf_file(page_size, invalid):
+    """Return the bytes of a 3 page test PDF, rendered once per page size and validity."""
+    # reportlab is only needed by the cooperative document cases, so defer loading it until a PDF is built
+    from reportlab.lib.pagesizes import letter  # pylint: disable=import-outside-toplevel
+    from reportlab.pdfgen import canvas  # pylint: disable=import-outside-toplevel
+
     buffer = io.BytesIO()
-    can = canvas.Canvas(buffer, pagesize=page_size)
+    can = canvas.Canvas(buffer, pagesize=page_size or letter)
     doc_height = letter[1]
 
     for _ in range(3):
@@ -1468,8 +943,7 @@ def _create_pdf_file(page_size, invalid):
         can.showPage()
 
     can.save()
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
 
 
 def _write_text(can, text, line_height, x_margin, y_margin):
@@ -1488,7 +962,7 @@ def _write_text(can, text, line_height, x_margin, y_margin):
     ])
 def test_validate_incorporation_agreement(test_name, legal_type, agreement_type, expected_msg):
     """Assert that incorporation agreement is 'custom' for ULC/CCC."""
-    filing_json = copy.deepcopy(INCORPORATION_FILING_TEMPLATE)
+    filing_json = _loads(_TEMPLATE_JSON)
     filing_json['filing'][incorporation_application_name]['nameRequest']['legalType'] = legal_type
     filing_json['filing'][incorporation_application_name]['incorporationAgreement']['agreementType'] = agreement_type
 
@@ -69,7 +69,7 @@ def test_validate_ar_basic(session, test_name, now, ar_date, agm_date,
         ('FAIL_ALL_ADDRESS_REGIONS', date(2020, 9, 17), 'WA', 'CA', 'WA', 'CA',
          HTTPStatus.BAD_REQUEST, [
              {'error': "Address Region must be 'BC'.",
-              'path': '/filing/changeOfAddress/offices/registeredOffice/mailingAddress/addressRegion'},
+              'path': '/filing/changeOfAddress/offices/registeredOffice/deliveryAddress/addressRegion'},
              {'error': "Address Region must be 'BC'.",
               'path': '/filing/changeOfAddress/offices/registeredOffice/mailingAddress/addressRegion'}
         ]),